@@ -11,13 +11,14 @@ from typing import TYPE_CHECKING
 from homeassistant.components import bluetooth
 from homeassistant.const import Platform
 
-from .const import DOMAIN, LOGGER
+from .const import LOGGER
 from .coordinator import NeoSmartBlueCoordinator
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+    from .coordinator import NeoSmartBlueConfigEntry
+
 PLATFORMS: list[Platform] = [
     Platform.COVER,
     Platform.SENSOR,
@@ -27,7 +28,7 @@ PLATFORMS: list[Platform] = [
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: NeoSmartBlueConfigEntry,
 ) -> bool:
     """Set up Neo Smart Blinds Blue from a config entry."""
     address: str = entry.data["address"]
@@ -43,9 +44,12 @@ async def async_setup_entry(
     # Create coordinator
     coordinator = NeoSmartBlueCoordinator(hass, ble_device)
 
-    # Store coordinator in hass data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Store coordinator on the config entry
+    entry.runtime_data = coordinator
+
+    # Forward entry setup to platforms before listening for advertisements so
+    # the first passive update already has entities to write state to
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Set up Bluetooth listener for passive updates
     LOGGER.info(
@@ -59,15 +63,17 @@ async def async_setup_entry(
         bluetooth.BluetoothScanningMode.PASSIVE,
     )
     entry.async_on_unload(callback_unregister)
+    entry.async_on_unload(
+        bluetooth.async_track_unavailable(
+            hass, coordinator.handle_unavailable, address, connectable=False
+        )
+    )
 
     LOGGER.info(
         "Successfully registered Bluetooth callback for device %s",
         address,
     )
 
-    # Forward entry setup to platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
     # Add update listener
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -76,22 +82,17 @@ async def async_setup_entry(
 
 async def async_unload_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: NeoSmartBlueConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    coordinator: NeoSmartBlueCoordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.async_shutdown()
-
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+    await entry.runtime_data.async_shutdown()
 
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def async_reload_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: NeoSmartBlueConfigEntry,
 ) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
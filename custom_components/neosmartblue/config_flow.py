@@ -14,6 +14,9 @@ from homeassistant.const import CONF_ADDRESS
 
 from .const import DOMAIN, NEOSMART_MANUFACTURER_ID
 
+# Advertised name prefixes used by NeoSmart Blue motors
+_NEOSMART_PREFIXES = ("NEO-", "NMB-")
+
 
 class NeoSmartBlueConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Neosmart Blinds Blue."""
@@ -89,8 +92,8 @@ class NeoSmartBlueConfigFlow(ConfigFlow, domain=DOMAIN):
     def _is_neosmart_device(self, discovery_info: BluetoothServiceInfoBleak) -> bool:
         """Check if discovery_info is a NeoSmart Blue device."""
         # Check device name for NeoSmart Blue patterns
-        name = discovery_info.name or ""
-        if name.startswith(("NEO-", "NMB-")):
+        name = discovery_info.name
+        if name and name.startswith(_NEOSMART_PREFIXES):
             return True
 
         # Also check manufacturer data for NeoSmart manufacturer ID
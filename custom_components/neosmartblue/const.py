@@ -14,5 +14,17 @@ MANUFACTURER = "NeoSmart"
 NEOSMART_MANUFACTURER_ID = 2407
 STATUS_PAYLOAD_LENGTH = 5
 
+# Minimum RSSI change before an otherwise unchanged advertisement is published
+RSSI_UPDATE_THRESHOLD = 3  # dBm
+
+# Dispatcher signal for RSSI-only updates, formatted with the device address
+SIGNAL_RSSI_UPDATED = f"{DOMAIN}_rssi_{{}}"
+
+# Connection handling
+CONNECT_ATTEMPTS = 3
+COMMAND_TIMEOUT = 10  # seconds
+CONNECTION_IDLE_TIMEOUT = 5  # seconds
+MOVE_COMMAND_DEBOUNCE = 0.1  # seconds
+
 # Scan intervals
 SCAN_INTERVAL = 30  # seconds
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from contextlib import asynccontextmanager
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from bleak import BleakClient
 from bleak.exc import BleakError
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from neosmartblue.py import BlueLinkDevice, parse_status_data
@@ -18,10 +23,114 @@ from neosmartblue.py import BlueLinkDevice, parse_status_data
 from . import const
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Mapping
 
     from bleak.backends.device import BLEDevice
 
+type NeoSmartBlueConfigEntry = ConfigEntry[NeoSmartBlueCoordinator]
+
+# Status reported before the first advertisement has been received
+_DEFAULT_STATUS: Mapping[str, Any] = MappingProxyType(
+    {
+        "battery_level": 0,
+        "current_position": 50,
+        "target_position": 50,
+        "limit_range_size": 0,
+        "motor_running": False,
+        "motor_direction_down": False,
+        "up_limit_set": False,
+        "down_limit_set": False,
+        "touch_control": False,
+        "charging": False,
+        "channel_setting_mode": False,
+        "reverse_rotation": False,
+    }
+)
+
+
+def _parse_advertisement_data(
+    service_info: bluetooth.BluetoothServiceInfoBleak,
+) -> dict[str, Any] | None:
+    """Parse advertisement data for status information."""
+    const.LOGGER.debug(
+        "Parsing advertisement from %s: manufacturer_data=%s",
+        service_info.device.address,
+        service_info.manufacturer_data,
+    )
+
+    if not service_info.manufacturer_data:
+        const.LOGGER.debug(
+            "No manufacturer data in advertisement from %s",
+            service_info.device.address,
+        )
+        return None
+
+    try:
+        # NeoSmart Blue devices use manufacturer ID 2407
+        if const.NEOSMART_MANUFACTURER_ID in service_info.manufacturer_data:
+            # parse_status_data only indexes the payload, so a view over
+            # the advertised bytes avoids copying it
+            status_payload = memoryview(
+                service_info.manufacturer_data[const.NEOSMART_MANUFACTURER_ID]
+            )
+
+            # Hex encoding allocates, so only do it when it will be logged
+            if const.LOGGER.isEnabledFor(logging.DEBUG):
+                const.LOGGER.debug(
+                    "Raw manufacturer data from %s: %s (length: %d)",
+                    service_info.device.address,
+                    status_payload.hex().upper(),
+                    len(status_payload),
+                )
+
+            if len(status_payload) >= const.STATUS_PAYLOAD_LENGTH:
+                # Parse the status data using the library
+                parsed_status = parse_status_data(
+                    status_payload[: const.STATUS_PAYLOAD_LENGTH]
+                )
+
+                # Add RSSI information captured with this advertisement
+                parsed_status["rssi"] = service_info.rssi
+
+                const.LOGGER.debug(
+                    "Successfully parsed status data from %s: %s",
+                    service_info.device.address,
+                    parsed_status,
+                )
+                return parsed_status
+
+            const.LOGGER.warning(
+                "Status payload too short from %s: %d bytes (expected %d)",
+                service_info.device.address,
+                len(status_payload),
+                const.STATUS_PAYLOAD_LENGTH,
+            )
+        elif const.LOGGER.isEnabledFor(logging.DEBUG):
+            const.LOGGER.debug(
+                "No NeoSmart manufacturer data from %s (found IDs: %s)",
+                service_info.device.address,
+                list(service_info.manufacturer_data.keys()),
+            )
+
+    except (ValueError, KeyError, IndexError, ImportError, AttributeError) as err:
+        const.LOGGER.error(
+            "Failed to parse advertisement data from %s: %s",
+            service_info.device.address,
+            err,
+        )
+
+    return None
+
+
+class _ManagedBlueLinkDevice(BlueLinkDevice):
+    """BlueLinkDevice that sends commands over a client owned by the coordinator."""
+
+    def __init__(self, address: str, client: BleakClientWithServiceCache) -> None:
+        """Initialize the device with an existing client."""
+        # BlueLinkDevice.__init__ would create a BleakClient we never use
+        self.address = address
+        self.client = client
+
 
 class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """
@@ -46,7 +155,27 @@ class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=None,  # We'll use passive scanning
         )
         self.device = device
+        # The MAC address never changes for a configured device
+        self._address = device.address
         self._connection_lock = asyncio.Lock()
+        self._client: BleakClientWithServiceCache | None = None
+        self._idle_disconnect: asyncio.TimerHandle | None = None
+        self._pending_position: int | None = None
+        self._move_flush: asyncio.TimerHandle | None = None
+        self._shutting_down = False
+        self._last_payload: bytes | None = None
+        self._last_rssi: int | None = None
+        # Shared by every entity of this device
+        self.device_info = DeviceInfo(
+            identifiers={(const.DOMAIN, device.address)},
+            connections={(CONNECTION_BLUETOOTH, device.address)},
+            name=device.name or "NeoSmart Blue Blind",
+            manufacturer=const.MANUFACTURER,
+            model="NeoSmart Blue Blind",
+        )
+        # Tracked from advertisements and unavailability callbacks so
+        # entities can read it without querying the Bluetooth manager
+        self.device_available = self.is_device_advertising()
 
         const.LOGGER.info(
             "Initialized NeoSmartBlueCoordinator for device %s",
@@ -63,12 +192,16 @@ class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 device.address,
             )
             # Try to parse any existing data
-            startup_data = self._parse_advertisement_data(service_info)
+            startup_data = _parse_advertisement_data(service_info)
             if startup_data:
                 const.LOGGER.info(
                     "Parsed startup advertisement data: %s",
                     startup_data,
                 )
+                # Start from the last known status instead of waiting for the
+                # next advertisement
+                self.data = startup_data
+                self._last_rssi = service_info.rssi
         else:
             const.LOGGER.info(
                 "No recent advertisement data found for %s on startup",
@@ -76,188 +209,260 @@ class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
     @asynccontextmanager
-    async def _managed_connection(self) -> AsyncIterator[BleakClient]:
-        """Provide a managed connection to the device."""
-        # First try to get a connectable device
-        ble_device = bluetooth.async_ble_device_from_address(
-            self.hass, self.device.address, connectable=True
-        )
+    async def _managed_connection(
+        self,
+    ) -> AsyncIterator[BleakClientWithServiceCache]:
+        """
+        Provide a managed connection to the device.
+
+        The connection is kept open after use so that commands sent in quick
+        succession share it, and is closed once it has been idle for
+        CONNECTION_IDLE_TIMEOUT seconds.
+        """
+        async with self._connection_lock:
+            self._cancel_idle_disconnect()
+            try:
+                client = await self._async_ensure_connected()
+                try:
+                    yield client
+                except BleakError:
+                    # A failed GATT operation on an open link may be caused by
+                    # stale cached services, so resolve them again next time
+                    await client.clear_cache()
+                    raise
+            except (OSError, TimeoutError, HomeAssistantError, BleakError):
+                # Callers report the failure once, with the command it affected
+                await self._async_disconnect()
+                raise
+            finally:
+                self._schedule_idle_disconnect()
 
-        # If no connectable device found, try getting any device and use it anyway
-        if not ble_device:
-            ble_device = bluetooth.async_ble_device_from_address(
-                self.hass, self.device.address, connectable=False
-            )
+    async def _async_ensure_connected(self) -> BleakClientWithServiceCache:
+        """Return the open client, connecting to the device if needed."""
+        if self._client is not None and self._client.is_connected:
+            return self._client
 
-        # If still no device, check if we have a recent advertisement
-        if not ble_device:
-            service_info = bluetooth.async_last_service_info(
-                self.hass, self.device.address, connectable=False
-            )
-            if service_info:
-                ble_device = service_info.device
+        # A command still waiting for the lock at shutdown must not reconnect
+        if self._shutting_down:
+            msg = f"Not reconnecting to {self._address} after shutdown"
+            raise HomeAssistantError(msg)
 
+        # Only a connectable scanner or proxy can reach the device; connecting
+        # through a device seen by a passive scanner is bound to fail
+        ble_device = bluetooth.async_ble_device_from_address(
+            self.hass, self._address, connectable=True
+        )
         if not ble_device:
-            msg = f"Device not available: {self.device.address}"
+            msg = (
+                f"Device not available: {self._address}; make sure it is in range "
+                "of a connectable Bluetooth adapter or ESPHome Bluetooth proxy"
+            )
             raise HomeAssistantError(msg)
 
-        async with self._connection_lock:
-            # Get a scanner to ensure we have the best connection strategy
-            scanner = bluetooth.async_get_scanner(self.hass)
-            if not scanner:
-                msg = "No Bluetooth scanner available"
-                raise HomeAssistantError(msg)
+        # establish_connection retries with backoff, manages proxy connection
+        # slots and reuses resolved GATT services on later connections
+        client = await establish_connection(
+            BleakClientWithServiceCache,
+            ble_device,
+            self._address,
+            max_attempts=const.CONNECT_ATTEMPTS,
+            use_services_cache=True,
+            ble_device_callback=lambda: (
+                bluetooth.async_ble_device_from_address(
+                    self.hass, self._address, connectable=True
+                )
+                or ble_device
+            ),
+        )
+        const.LOGGER.debug(
+            "Successfully connected to %s via BleakClient",
+            self._address,
+        )
+        self._client = client
+        return client
 
-            client = BleakClient(ble_device)
-            try:
-                # Use a longer timeout for connection attempts as recommended
-                # for devices that might need service resolution
-                await client.connect(timeout=15.0)
+    async def _async_disconnect(self) -> None:
+        """Disconnect the open client, if any."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+
+        try:
+            if client.is_connected:
+                await client.disconnect()
                 const.LOGGER.debug(
-                    "Successfully connected to %s via BleakClient",
-                    self.device.address,
-                )
-                yield client
-            except (OSError, TimeoutError, HomeAssistantError, BleakError) as err:
-                const.LOGGER.error(
-                    "Failed to connect to %s: %s",
-                    self.device.address,
-                    err,
+                    "Disconnected from %s",
+                    self._address,
                 )
-                raise
-            finally:
-                try:
-                    if client.is_connected:
-                        await client.disconnect()
-                        const.LOGGER.debug(
-                            "Disconnected from %s",
-                            self.device.address,
-                        )
-                except (OSError, TimeoutError, HomeAssistantError, BleakError) as err:
-                    const.LOGGER.warning(
-                        "Error during disconnect from %s: %s",
-                        self.device.address,
-                        err,
-                    )
+        except (OSError, TimeoutError, HomeAssistantError, BleakError) as err:
+            const.LOGGER.warning(
+                "Error during disconnect from %s: %s",
+                self._address,
+                err,
+            )
+
+    @callback
+    def _schedule_idle_disconnect(self) -> None:
+        """Arm the idle timer for the open connection."""
+        self._cancel_idle_disconnect()
+        if self._client is not None:
+            self._idle_disconnect = self.hass.loop.call_later(
+                const.CONNECTION_IDLE_TIMEOUT, self._handle_idle_timeout
+            )
+
+    @callback
+    def _cancel_idle_disconnect(self) -> None:
+        """Cancel a pending idle disconnect."""
+        if self._idle_disconnect is not None:
+            self._idle_disconnect.cancel()
+            self._idle_disconnect = None
+
+    @callback
+    def _handle_idle_timeout(self) -> None:
+        """Close the connection once it has been idle."""
+        self._idle_disconnect = None
+        self.hass.async_create_background_task(
+            self._async_idle_disconnect(),
+            f"{self.name} idle disconnect",
+        )
+
+    async def _async_idle_disconnect(self) -> None:
+        """Disconnect unless a command has used the connection meanwhile."""
+        async with self._connection_lock:
+            # A command that ran while we waited re-arms the timer
+            if self._idle_disconnect is None:
+                await self._async_disconnect()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the device."""
         # For NeoSmart Blue, we rely entirely on advertisements for status data
         # Return existing data or default values - no active polling
         return self.data or {
-            "battery_level": 0,
-            "current_position": 50,
-            "target_position": 50,
-            "limit_range_size": 0,
-            # BLEDevice may not expose an rssi attribute in newer
-            # HA/Bleak versions; fetch it if present
-            "rssi": (getattr(self.device, "rssi", None) or -60),
-            "motor_running": False,
-            "motor_direction_down": False,
-            "up_limit_set": False,
-            "down_limit_set": False,
-            "touch_control": False,
-            "charging": False,
-            "channel_setting_mode": False,
-            "reverse_rotation": False,
+            **_DEFAULT_STATUS,
+            # Last RSSI seen in an advertisement; BLEDevice.rssi is stale
+            "rssi": self._last_rssi,
         }
 
-    def _create_bluelink_device(self, client: BleakClient) -> Any:
+    def _create_bluelink_device(
+        self, client: BleakClientWithServiceCache
+    ) -> BlueLinkDevice:
         """Create a BlueLinkDevice with injected client."""
-        bluelink_device = BlueLinkDevice(self.device.address)
-        # Inject our managed client into the device
-        object.__setattr__(bluelink_device, "client", client)
-        return bluelink_device
+        return _ManagedBlueLinkDevice(self._address, client)
 
     async def send_move_command(self, position: int) -> None:
-        """Send move command to the device."""
+        """
+        Queue a move command for the device.
+
+        Moves requested within MOVE_COMMAND_DEBOUNCE seconds of each other are
+        coalesced, so a burst of position changes only sends the last one.
+        """
         const.LOGGER.debug(
-            "Attempting to send move command to position %d for %s",
+            "Queueing move command to position %d for %s",
             position,
-            self.device.address,
+            self._address,
+        )
+        self._pending_position = position
+        if self._move_flush is not None:
+            self._move_flush.cancel()
+        self._move_flush = self.hass.loop.call_later(
+            const.MOVE_COMMAND_DEBOUNCE, self._handle_move_flush
         )
 
-        # Check if device is present and connectable before attempting connection
-        if not bluetooth.async_address_present(
-            self.hass, self.device.address, connectable=True
-        ):
-            const.LOGGER.warning(
-                "Device %s is not present or not connectable, cannot send move command",
-                self.device.address,
-            )
+    @callback
+    def _handle_move_flush(self) -> None:
+        """Send the queued move command once the debounce window has passed."""
+        self._move_flush = None
+        self.hass.async_create_task(
+            self._async_flush_move(),
+            f"{self.name} move command",
+            eager_start=True,
+        )
+
+    @callback
+    def _cancel_pending_move(self) -> None:
+        """Drop a queued move command that has not been sent yet."""
+        if self._move_flush is not None:
+            self._move_flush.cancel()
+            self._move_flush = None
+        self._pending_position = None
+
+    async def _async_flush_move(self) -> None:
+        """Send the most recently queued move command to the device."""
+        if self._pending_position is None:
             return
 
-        # Check if we have a connectable device available
-        ble_device = bluetooth.async_ble_device_from_address(
-            self.hass, self.device.address, connectable=True
+        const.LOGGER.debug(
+            "Attempting to send move command for %s",
+            self._address,
         )
-        if not ble_device:
-            const.LOGGER.warning(
-                "No connectable device found for %s, cannot send move command",
-                self.device.address,
-            )
-            return
 
         try:
             async with self._managed_connection() as client:
+                # Read the queued position only once the lock is held, so moves
+                # queued while another command held the connection collapse
+                # into one and a stop sent meanwhile still cancels them
+                position, self._pending_position = self._pending_position, None
+                if position is None:
+                    return
+
                 const.LOGGER.debug(
                     "Successfully connected to %s for move command",
-                    self.device.address,
+                    self._address,
                 )
 
                 # Use the neosmartblue library to send move command
                 bluelink_device = self._create_bluelink_device(client)
 
-                await bluelink_device.move_to_position(position)
+                # establish_connection bounds the connect, but not a GATT
+                # write that stalls on an open link while holding the lock
+                async with asyncio.timeout(const.COMMAND_TIMEOUT):
+                    await bluelink_device.move_to_position(position)
                 const.LOGGER.info("Sent move command to position %d", position)
-        except (OSError, TimeoutError, HomeAssistantError, BleakError) as err:
+        except HomeAssistantError as err:
+            # The device cannot be reached right now, e.g. it is out of range
+            const.LOGGER.warning(
+                "Cannot send move command to %s: %s",
+                self._address,
+                err,
+            )
+        except (OSError, TimeoutError, BleakError) as err:
             const.LOGGER.error(
                 "Failed to send move command to %s: %s",
-                self.device.address,
+                self._address,
                 err,
             )
 
     async def send_stop_command(self) -> None:
         """Send stop command to the device."""
-        const.LOGGER.debug("Attempting to send stop command to %s", self.device.address)
+        const.LOGGER.debug("Attempting to send stop command to %s", self._address)
 
-        # Check if device is present and connectable before attempting connection
-        if not bluetooth.async_address_present(
-            self.hass, self.device.address, connectable=True
-        ):
-            const.LOGGER.warning(
-                "Device %s is not present or not connectable, cannot send stop command",
-                self.device.address,
-            )
-            return
-
-        # Check if we have a connectable device available
-        ble_device = bluetooth.async_ble_device_from_address(
-            self.hass, self.device.address, connectable=True
-        )
-        if not ble_device:
-            const.LOGGER.warning(
-                "No connectable device found for %s, cannot send stop command",
-                self.device.address,
-            )
-            return
+        # A stop overrides any move that has not been sent yet
+        self._cancel_pending_move()
 
         try:
             async with self._managed_connection() as client:
                 const.LOGGER.debug(
                     "Successfully connected to %s for stop command",
-                    self.device.address,
+                    self._address,
                 )
 
                 # Use the neosmartblue library to send stop command
                 bluelink_device = self._create_bluelink_device(client)
 
-                await bluelink_device.stop()
+                async with asyncio.timeout(const.COMMAND_TIMEOUT):
+                    await bluelink_device.stop()
                 const.LOGGER.info("Sent stop command")
-        except (OSError, TimeoutError, HomeAssistantError, BleakError) as err:
+        except HomeAssistantError as err:
+            # The device cannot be reached right now, e.g. it is out of range
+            const.LOGGER.warning(
+                "Cannot send stop command to %s: %s",
+                self._address,
+                err,
+            )
+        except (OSError, TimeoutError, BleakError) as err:
             const.LOGGER.error(
                 "Failed to send stop command to %s: %s",
-                self.device.address,
+                self._address,
                 err,
             )
 
@@ -268,7 +473,8 @@ class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         change: bluetooth.BluetoothChange,
     ) -> None:
         """Handle bluetooth events."""
-        const.LOGGER.info(
+        # Called for every advertisement, so keep per-event logging at debug
+        const.LOGGER.debug(
             "Bluetooth event received for device %s: change=%s, name=%s",
             service_info.device.address,
             change,
@@ -276,23 +482,38 @@ class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
         if change == bluetooth.BluetoothChange.ADVERTISEMENT:
-            # Update device data from advertisement
-            self.device = service_info.device
+            if not self.device_available:
+                self.device_available = True
+                self.async_update_listeners()
+
+            # Advertisements without NeoSmart manufacturer data carry no status
+            raw = service_info.manufacturer_data.get(const.NEOSMART_MANUFACTURER_ID)
+            if not raw:
+                return
+
+            # Devices repeat the same status payload several times a second,
+            # so skip parsing and listener updates when nothing has changed
+            payload = bytes(raw[: const.STATUS_PAYLOAD_LENGTH])
+            if payload == self._last_payload:
+                self._async_update_rssi(service_info.rssi)
+                return
 
             # Parse manufacturer data for status information
-            status_data = self._parse_advertisement_data(service_info)
+            status_data = _parse_advertisement_data(service_info)
             if status_data:
-                const.LOGGER.info(
+                self._last_payload = payload
+                self._last_rssi = service_info.rssi
+                const.LOGGER.debug(
                     "Successfully parsed advertisement data from %s: %s",
-                    self.device.address,
+                    self._address,
                     status_data,
                 )
                 self.async_set_updated_data(status_data)
             else:
-                const.LOGGER.info(
+                const.LOGGER.debug(
                     "Advertisement from %s without valid status data "
                     "(manufacturer_data: %s)",
-                    self.device.address,
+                    self._address,
                     service_info.manufacturer_data,
                 )
         else:
@@ -301,99 +522,54 @@ class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 change,
             )
 
-    def _parse_advertisement_data(
+    @callback
+    def handle_unavailable(
         self, service_info: bluetooth.BluetoothServiceInfoBleak
-    ) -> dict[str, Any] | None:
-        """Parse advertisement data for status information."""
-        const.LOGGER.debug(
-            "Parsing advertisement from %s: manufacturer_data=%s",
-            service_info.device.address,
-            service_info.manufacturer_data,
-        )
-
-        if not service_info.manufacturer_data:
-            const.LOGGER.debug(
-                "No manufacturer data in advertisement from %s",
-                service_info.device.address,
-            )
-            return None
-
-        try:
-            # NeoSmart Blue devices use manufacturer ID 2407
-            if const.NEOSMART_MANUFACTURER_ID in service_info.manufacturer_data:
-                manufacturer_data = service_info.manufacturer_data[
-                    const.NEOSMART_MANUFACTURER_ID
-                ]
-                status_payload = bytearray(manufacturer_data)
-
-                const.LOGGER.debug(
-                    "Raw manufacturer data from %s: %s (length: %d)",
-                    service_info.device.address,
-                    status_payload.hex().upper(),
-                    len(status_payload),
-                )
-
-                if len(status_payload) >= const.STATUS_PAYLOAD_LENGTH:
-                    # Parse the status data using the library
-                    parsed_status = parse_status_data(
-                        status_payload[: const.STATUS_PAYLOAD_LENGTH]
-                    )
-
-                    # Add RSSI information
-                    # Prefer service_info.rssi; fall back to device
-                    # attribute if service_info does not provide one
-                    parsed_status["rssi"] = (
-                        service_info.rssi
-                        if getattr(service_info, "rssi", None) is not None
-                        else getattr(service_info.device, "rssi", -60) or -60
-                    )
-
-                    const.LOGGER.info(
-                        "Successfully parsed status data from %s: %s",
-                        service_info.device.address,
-                        parsed_status,
-                    )
-                    return parsed_status
-
-                const.LOGGER.warning(
-                    "Status payload too short from %s: %d bytes (expected %d)",
-                    service_info.device.address,
-                    len(status_payload),
-                    const.STATUS_PAYLOAD_LENGTH,
-                )
-            else:
-                const.LOGGER.debug(
-                    "No NeoSmart manufacturer data from %s (found IDs: %s)",
-                    service_info.device.address,
-                    list(service_info.manufacturer_data.keys()),
-                )
+    ) -> None:
+        """Handle the device no longer being seen by any scanner."""
+        const.LOGGER.debug("Device %s is no longer available", service_info.address)
+        self.device_available = False
+        self.async_update_listeners()
 
-        except (ValueError, KeyError, IndexError, ImportError, AttributeError) as err:
-            const.LOGGER.error(
-                "Failed to parse advertisement data from %s: %s",
-                service_info.device.address,
-                err,
-            )
+    @callback
+    def _async_update_rssi(self, rssi: int) -> None:
+        """Publish a signal strength change to the RSSI sensor only."""
+        if (
+            self._last_rssi is not None
+            and abs(rssi - self._last_rssi) < const.RSSI_UPDATE_THRESHOLD
+        ):
+            return
 
-        return None
+        self._last_rssi = rssi
+        # Replace rather than mutate the published status, which listeners
+        # may still hold a reference to
+        self.data = {**self.data, "rssi": rssi}
+        async_dispatcher_send(
+            self.hass, const.SIGNAL_RSSI_UPDATED.format(self._address)
+        )
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
-        # Connections are now managed per-operation, so nothing to do on shutdown.
+        await super().async_shutdown()
+        self._shutting_down = True
+        self._cancel_pending_move()
+        self._cancel_idle_disconnect()
+        async with self._connection_lock:
+            await self._async_disconnect()
 
     def is_device_advertising(self) -> bool:
         """Check if the device is currently advertising."""
         return bluetooth.async_address_present(
-            self.hass, self.device.address, connectable=False
+            self.hass, self._address, connectable=False
         )
 
     def get_latest_advertisement_data(self) -> dict[str, Any] | None:
         """Get the latest advertisement data without connection."""
         service_info = bluetooth.async_last_service_info(
-            self.hass, self.device.address, connectable=False
+            self.hass, self._address, connectable=False
         )
         if service_info:
-            return self._parse_advertisement_data(service_info)
+            return _parse_advertisement_data(service_info)
         return None
 
     async def refresh_advertisement_data(self) -> None:
@@ -404,20 +580,20 @@ class NeoSmartBlueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if latest_data:
             const.LOGGER.debug(
                 "Manually refreshed advertisement data for %s: %s",
-                self.device.address,
+                self._address,
                 latest_data,
             )
             self.async_set_updated_data(latest_data)
         else:
             const.LOGGER.debug(
                 "No advertisement data available for manual refresh for %s",
-                self.device.address,
+                self._address,
             )
 
     def is_device_connectable(self) -> bool:
         """Check if the device is currently connectable."""
         return bool(
             bluetooth.async_ble_device_from_address(
-                self.hass, self.device.address, connectable=True
+                self.hass, self._address, connectable=True
             )
         )
@@ -10,16 +10,15 @@ from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
 )
+from homeassistant.core import callback
 
-from .const import DOMAIN
 from .entity import NeoSmartBlueEntity
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import NeoSmartBlueCoordinator
+    from .coordinator import NeoSmartBlueConfigEntry, NeoSmartBlueCoordinator
 
 # Position constants
 FULLY_OPEN = 100
@@ -27,12 +26,12 @@ FULLY_CLOSED = 0
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: NeoSmartBlueConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the cover platform."""
-    coordinator: NeoSmartBlueCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     async_add_entities([NeoSmartBlueCover(coordinator)])
 
 
@@ -46,6 +45,9 @@ class NeoSmartBlueCover(NeoSmartBlueEntity, CoverEntity):
         | CoverEntityFeature.STOP
         | CoverEntityFeature.SET_POSITION
     )
+    _attr_is_closed: bool | None = None
+    _attr_is_opening = False
+    _attr_is_closing = False
 
     def __init__(self, coordinator: NeoSmartBlueCoordinator) -> None:
         """Initialize the cover."""
@@ -53,48 +55,27 @@ class NeoSmartBlueCover(NeoSmartBlueEntity, CoverEntity):
         self._attr_unique_id = f"{coordinator.device.address}_cover"
         self._attr_name = "Blind"
 
-    @property
-    def current_cover_position(self) -> int | None:
-        """Return current position of cover."""
-        if self.coordinator.data:
-            # Invert position so 100 is open
-            pos = self.coordinator.data.get("current_position")
-            if pos is not None:
-                return 100 - pos
-        return None
-
-    @property
-    def is_closed(self) -> bool | None:
-        """Return if the cover is closed or not."""
-        position = self.current_cover_position
-        return position == FULLY_CLOSED if position is not None else None
-
-    @property
-    def is_opening(self) -> bool:
-        """Return if the cover is opening or not."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(
-                "motor_running", False
-            ) and self.coordinator.data.get("motor_direction_down", False)
-        return False
+    @callback
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Update the cover state from the latest status data."""
+        # Invert position so 100 is open
+        pos = data.get("current_position")
+        position = 100 - pos if pos is not None else None
+        self._attr_current_cover_position = position
+        self._attr_is_closed = (
+            position == FULLY_CLOSED if position is not None else None
+        )
 
-    @property
-    def is_closing(self) -> bool:
-        """Return if the cover is closing or not."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(
-                "motor_running", False
-            ) and not self.coordinator.data.get("motor_direction_down", False)
-        return False
+        motor_running = data.get("motor_running", False)
+        direction_down = data.get("motor_direction_down", False)
+        self._attr_is_opening = motor_running and direction_down
+        self._attr_is_closing = motor_running and not direction_down
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        # Device is available if we can see advertisements or it's connectable
-        return (
-            self.coordinator.is_device_advertising()
-            or self.coordinator.is_device_connectable()
-        )
+        # Device is available while any scanner can see its advertisements
+        return self.coordinator.device_available
 
     async def async_open_cover(self, **_kwargs: Any) -> None:
         """Open the cover."""
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
 from .coordinator import NeoSmartBlueCoordinator
 
 
@@ -17,9 +18,17 @@ class NeoSmartBlueEntity(CoordinatorEntity[NeoSmartBlueCoordinator]):
     def __init__(self, coordinator: NeoSmartBlueCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.device.address)},
-            name=coordinator.device.name or "NeoSmart Blue Blind",
-            manufacturer=MANUFACTURER,
-            model="NeoSmart Blue Blind",
-        )
+        self._attr_device_info = coordinator.device_info
+        if coordinator.data:
+            self._update_attrs(coordinator.data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.coordinator.data:
+            self._update_attrs(self.coordinator.data)
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Update the entity attributes from the latest status data."""
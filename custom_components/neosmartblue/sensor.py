@@ -2,146 +2,134 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
 )
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import SIGNAL_RSSI_UPDATED
 from .entity import NeoSmartBlueEntity
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import NeoSmartBlueCoordinator
+    from .coordinator import NeoSmartBlueConfigEntry, NeoSmartBlueCoordinator
+
+
+@dataclass(frozen=True, kw_only=True)
+class NeoSmartBlueSensorEntityDescription(SensorEntityDescription):
+    """Describes a NeoSmart Blue sensor."""
+
+    # Status data key; the description key is the unique ID suffix
+    data_key: str
+
+
+SENSOR_DESCRIPTIONS: tuple[NeoSmartBlueSensorEntityDescription, ...] = (
+    NeoSmartBlueSensorEntityDescription(
+        key="battery",
+        data_key="battery_level",
+        name="Battery Level",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    NeoSmartBlueSensorEntityDescription(
+        key="position",
+        data_key="current_position",
+        name="Position",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    NeoSmartBlueSensorEntityDescription(
+        key="target_position",
+        data_key="target_position",
+        name="Target Position",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+    ),
+    NeoSmartBlueSensorEntityDescription(
+        key="limit_range",
+        data_key="limit_range_size",
+        name="Limit Range Size",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+# Kept separate as its entity also listens for RSSI-only updates
+RSSI_DESCRIPTION = NeoSmartBlueSensorEntityDescription(
+    key="rssi",
+    data_key="rssi",
+    name="Signal Strength",
+    device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    entity_registry_enabled_default=False,
+)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: NeoSmartBlueConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    coordinator: NeoSmartBlueCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     async_add_entities(
         [
-            NeoSmartBlueBatterySensor(coordinator),
-            NeoSmartBlueRSSISensor(coordinator),
-            NeoSmartBluePositionSensor(coordinator),
-            NeoSmartBlueTargetPositionSensor(coordinator),
-            NeoSmartBlueLimitRangeSensor(coordinator),
+            *(
+                NeoSmartBlueSensor(coordinator, description)
+                for description in SENSOR_DESCRIPTIONS
+            ),
+            NeoSmartBlueRSSISensor(coordinator, RSSI_DESCRIPTION),
         ]
     )
 
 
-class NeoSmartBlueBatterySensor(NeoSmartBlueEntity, SensorEntity):
-    """Battery level sensor for NeoSmart Blue blind."""
+class NeoSmartBlueSensor(NeoSmartBlueEntity, SensorEntity):
+    """Status value sensor for NeoSmart Blue blind."""
 
-    _attr_device_class = SensorDeviceClass.BATTERY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
+    entity_description: NeoSmartBlueSensorEntityDescription
 
-    def __init__(self, coordinator: NeoSmartBlueCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: NeoSmartBlueCoordinator,
+        description: NeoSmartBlueSensorEntityDescription,
+    ) -> None:
         """Initialize the sensor."""
+        self.entity_description = description
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.device.address}_battery"
-        self._attr_name = "Battery Level"
+        self._attr_unique_id = f"{coordinator.device.address}_{description.key}"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the battery level."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("battery_level")
-        return None
+    @callback
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Update the sensor value from the latest status data."""
+        self._attr_native_value = data.get(self.entity_description.data_key)
 
 
-class NeoSmartBlueRSSISensor(NeoSmartBlueEntity, SensorEntity):
+class NeoSmartBlueRSSISensor(NeoSmartBlueSensor):
     """RSSI sensor for NeoSmart Blue blind."""
 
-    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: NeoSmartBlueCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.device.address}_rssi"
-        self._attr_name = "Signal Strength"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the RSSI value."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("rssi")
-        return None
-
-
-class NeoSmartBluePositionSensor(NeoSmartBlueEntity, SensorEntity):
-    """Position sensor for NeoSmart Blue blind."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-
-    def __init__(self, coordinator: NeoSmartBlueCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.device.address}_position"
-        self._attr_name = "Position"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the current position."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("current_position")
-        return None
-
-
-class NeoSmartBlueTargetPositionSensor(NeoSmartBlueEntity, SensorEntity):
-    """Target position sensor for NeoSmart Blue blind."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: NeoSmartBlueCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.device.address}_target_position"
-        self._attr_name = "Target Position"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the target position."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("target_position")
-        return None
-
-
-class NeoSmartBlueLimitRangeSensor(NeoSmartBlueEntity, SensorEntity):
-    """Limit range sensor for NeoSmart Blue blind."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: NeoSmartBlueCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.device.address}_limit_range"
-        self._attr_name = "Limit Range Size"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the limit range size."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("limit_range_size")
-        return None
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to RSSI-only updates from the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_RSSI_UPDATED.format(self.coordinator.device.address),
+                self._handle_coordinator_update,
+            )
+        )